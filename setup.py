@@ -1,21 +1,24 @@
-from setuptools import find_namespace_packages, setup
+from setuptools import Extension, setup
 
-setup(
-    name="spiir-search",
-    version="0.0.2",
-    package_dir={"": "src"},
-    packages=find_namespace_packages(where="src", include=["spiir*"]),
-    namespace_packages=["spiir"],
-    python_requires=">=3.8",
-    install_requires=[
-        "numpy",
-        "matplotlib",
-        "scikit-learn>=1.0",
-        "pycbc @ git+https://github.com/gwastro/pycbc.git@master#egg=pycbc",
-        "p_astro @ git+https://git.ligo.org/spiir-group/p-astro.git@feature/enable_pickle_compat#egg=p_astro",
-    ],
-    include_package_data=True,
-    description="A Python library for SPIIR gravitational wave search algorithms.",
-    author="Daniel Tang",
-    author_email="daniel.tang@uwa.edu.au",
-)
+# all package metadata and dependencies live in pyproject.toml; this shim only
+# remains for legacy tooling and for registering compiled extensions
+
+try:
+    from Cython.Build import cythonize
+
+    # optional AOT build of the fused p_astro kernel - models.py falls back to
+    # the numba or NumPy paths when this extension is not built
+    ext_modules = cythonize(
+        [
+            Extension(
+                "spiir.search.p_astro._pastro_c",
+                ["src/spiir/search/p_astro/_pastro_c.pyx"],
+                extra_compile_args=["-O3", "-ffast-math"],
+            )
+        ],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
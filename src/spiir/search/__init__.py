@@ -1 +1,3 @@
-from . import p_astro
+import lazy_loader as lazy
+
+__getattr__, __dir__, __all__ = lazy.attach(__name__, submodules=["p_astro"])
@@ -1,3 +1,10 @@
-from . import mchirp_area, models
-from .mchirp_area import ChirpMassAreaModel
-from .models import CompositeModel, TwoComponentModel
+import lazy_loader as lazy
+
+__getattr__, __dir__, __all__ = lazy.attach(
+    __name__,
+    submodules=["mchirp_area", "models"],
+    submod_attrs={
+        "mchirp_area": ["ChirpMassAreaModel"],
+        "models": ["CompositeModel", "TwoComponentModel"],
+    },
+)
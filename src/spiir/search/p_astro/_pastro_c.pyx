@@ -0,0 +1,35 @@
+# cython: language_level=3
+"""AOT compiled fused p_astro kernel.
+
+Ahead-of-time alternative to the numba JIT in models.py for deployments where
+first-call compilation warm-up is unacceptable. Built optionally by setup.py
+when Cython and a C compiler are available; models.py falls back to the numba
+or NumPy paths when this extension is absent.
+"""
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef void pastro_kernel(
+    double[::1] far,
+    double[::1] snr,
+    double far_star,
+    double snr_star,
+    double mean_astro,
+    double mean_terr,
+    double[::1] out,
+) nogil:
+    """Writes the two component posterior p_astro for each event into ``out``.
+
+    Fuses the FGMC bayes factor 3*snr_star^3*far_star / (far*snr^4) with the
+    closed-form posterior Na*bf / (Na*bf + Nt) in a single pass.
+    """
+    cdef Py_ssize_t i
+    cdef double c = 3.0 * snr_star ** 3.0 * far_star
+    cdef double x
+    for i in range(far.shape[0]):
+        x = mean_astro * c / (far[i] * snr[i] ** 4.0)
+        out[i] = x / (x + mean_terr)
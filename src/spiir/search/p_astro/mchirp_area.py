@@ -19,15 +19,20 @@ from pathlib import Path
 from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
-from astropy.utils.exceptions import AstropyUserWarning
 from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
-from numpy.polynomial import Polynomial
-from pycbc.conversions import mass2_from_mchirp_mass1 as mcm1_to_m2
-from pycbc.mchirp_area import calc_areas, redshift_estimation, src_mass_from_z_det_mass
+
+from ._area_kernels import calc_source_areas, make_region_grids
 
 logger = logging.getLogger(__name__)
 
+# Planck15 cosmology parameters as defined in lalsuite, see pycbc.mchirp_area
+LAL_COSMOLOGY_PARAMS = {"H0": 67.90, "Om0": 0.3065}
+
+# luminosity distance grid bounds (Mpc) and size for redshift interpolation
+REDSHIFT_GRID_BOUNDS = (1.0, 1e5)
+REDSHIFT_GRID_SIZE = 4096
+
 SOURCE_COLOR_MAP = {
     "BNS": "#A2C8F5",  # light blue
     "NSBH": "#FFB482",  # light orange
@@ -40,6 +45,24 @@ SOURCE_COLOR_MAP = {
 
 
 class ChirpMassAreaModel:
+    __slots__ = (
+        "a0",
+        "b0",
+        "_b1",
+        "m0",
+        "mass_bounds",
+        "ns_max",
+        "mass_gap_max",
+        "separate_mass_gap",
+        "lal_cosmology",
+        "fast",
+        "_dtype",
+        "_redshift_interpolant",
+        "_exp_b1",
+        "_region_grids",
+        "_repr_cache",
+    )
+
     def __init__(
         self,
         a0: Optional[float] = None,
@@ -51,6 +74,8 @@ class ChirpMassAreaModel:
         mass_gap_max: Optional[float] = None,
         separate_mass_gap: bool = False,
         lal_cosmology: bool = True,
+        fast: bool = True,
+        dtype: Union[str, np.dtype] = np.float64,
     ):
         """Defines a Compact Binary Coalescence source classifier class based on the
         PyCBC Chirp Mass Area method (mchirp_area.py) by Villa-Ortega et. al. (2021).
@@ -77,6 +102,15 @@ class ChirpMassAreaModel:
         lal_cosmology: bool
             If True, it uses the Planck15 cosmology model as defined in
              lalsuite instead of the astropy default.
+        fast: bool
+            If True (default), the chirp mass contour areas are integrated with
+            the local fixed-grid quadrature kernels (JIT compiled when numba is
+            installed). If False, fall back to pycbc.mchirp_area.calc_areas,
+            which is useful for validating results against upstream.
+        dtype: str | np.dtype
+            The floating point precision that batched predict inputs are cast
+            to. float32 halves the bytes moved through the hot path, shifting
+            p_astro well below the model fit uncertainty. Default is float64.
         """
         # model coefficients
         self.a0, self.b0, self.b1, self.m0 = a0, b0, b1, m0
@@ -89,9 +123,26 @@ class ChirpMassAreaModel:
         assert 0 < ns_max <= (self.mass_gap_max or ns_max)
 
         self.lal_cosmology = lal_cosmology
+        self.fast = fast
+        self.dtype = dtype
+
+        # lazily built log(distance) -> redshift interpolation table cache
+        self._redshift_interpolant: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+        # lazily built per-region quadrature grid cache for the fast path
+        self._region_grids: Optional[list] = None
+
+        # last computed repr string keyed on the coefficients it rendered
+        self._repr_cache: Tuple = (None, None)
 
     def __repr__(self, precision: int = 4):
         """Overrides string representation of cls when printed."""
+        # cache the rendered string keyed on the coefficients, as repr can sit
+        # in tight logging paths during cross-validation or bootstrap refits
+        key = (self.a0, self.b0, self.b1, self.m0, precision)
+        if self._repr_cache[0] == key:
+            return self._repr_cache[1]
+
         coefficents = ", ".join(
             [
                 f"{key}={self.coefficients[key]!r}"
@@ -100,52 +151,167 @@ class ChirpMassAreaModel:
                 for key in self.coefficients
             ]
         )
-        return f"{type(self).__name__}({coefficents})"
+        rendered = f"{type(self).__name__}({coefficents})"
+        self._repr_cache = (key, rendered)
+        return rendered
 
     @property
     def coefficients(self):
         return {"a0": self.a0, "b0": self.b0, "b1": self.b1, "m0": self.m0}
 
-    def estimate_luminosity_distance(self, eff_distance: float) -> float:
-        assert self.a0 is not None, "coefficient 'a0' is not initialised"
+    @property
+    def b1(self) -> Optional[float]:
+        """Model coefficient used to estimate luminosity distance uncertainty."""
+        return self._b1
+
+    @b1.setter
+    def b1(self, value: Optional[float]):
+        self._b1 = value
+        # keep exp(b1) in lockstep so the hot path never recomputes it
+        self._exp_b1 = None if value is None else float(np.exp(value))
+
+    @property
+    def dtype(self) -> np.dtype:
+        """The floating point precision used for batched prediction inputs."""
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value: Union[str, np.dtype]):
+        self._dtype = np.dtype(value)
+
+    @property
+    def source_classes(self) -> Tuple[str, ...]:
+        """The source class labels predicted by the model, in a fixed order."""
+        classes = ["BNS", "NSBH", "BBH"]
+        if self.mass_gap_max is not None and self.mass_gap_max > self.ns_max:
+            if self.separate_mass_gap:
+                classes += ["MGNS", "MGMG", "BHMG"]
+            else:
+                classes.append("MG")
+        return tuple(classes)
+
+    def _validate(self):
+        """Checks that all model coefficients are initialised, raising otherwise.
+
+        Called once after fitting or loading (and once per predict) instead of
+        asserting each coefficient on every hot path method call.
+        """
+        missing = [key for key, value in self.coefficients.items() if value is None]
+        if missing:
+            raise RuntimeError(f"Model coefficients not initialised: {missing}.")
+
+    def estimate_luminosity_distance(
+        self, eff_distance: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """Estimates luminosity distance from effective distance via the fitted
+        a0 coefficient. Internal hot paths inline this multiply directly."""
         return eff_distance * self.a0
 
     def estimate_luminosity_distance_uncertainty(
         self,
-        eff_distance: float,
-        snr: float,
-    ) -> float:
-        assert self.b0 is not None, "coefficient 'b0' is not initialised"
-        assert self.b1 is not None, "coefficient 'b1' is not initialised"
-
-        return (
-            np.power(snr, self.b0)
-            + np.exp(self.b1)
-            + self.estimate_luminosity_distance(eff_distance)
-        )
-
-    def estimate_distance(self, eff_distance: float, snr: float) -> Tuple[float, float]:
-        distance = self.estimate_luminosity_distance(eff_distance)
+        eff_distance: Union[float, np.ndarray],
+        snr: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
+        # evaluate snr**b0 as exp(b0*log(snr)) in-place - one temporary and a
+        # cheaper transcendental than the libm pow dispatched by np.power
+        scalar_input = np.ndim(snr) == 0
+        if scalar_input:
+            # promote to 1-d: ufuncs on 0-d inputs return scalars, which the
+            # in-place out= calls below cannot accept
+            snr = np.atleast_1d(np.asarray(snr, dtype=np.float64))
+        snr_pow_b0 = np.log(snr)
+        np.multiply(snr_pow_b0, self.b0, out=snr_pow_b0)
+        np.exp(snr_pow_b0, out=snr_pow_b0)
+
+        uncertainty = snr_pow_b0 + self._exp_b1 + self.a0 * eff_distance
+        return float(uncertainty[0]) if scalar_input else uncertainty
+
+    def estimate_distance(
+        self,
+        eff_distance: Union[float, np.ndarray],
+        snr: Union[float, np.ndarray],
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        # inline the a0 multiply rather than paying method dispatch per event
+        distance = self.a0 * eff_distance
         distance_std = self.estimate_luminosity_distance_uncertainty(eff_distance, snr)
         return distance, distance_std
 
+    def _build_redshift_interpolant(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Builds a log(luminosity distance) to redshift interpolation table by
+        inverting the model cosmology once over a fixed grid of distances."""
+        from astropy import units
+        from astropy.cosmology import FlatLambdaCDM, Planck15, z_at_value
+
+        if self.lal_cosmology:
+            cosmology = FlatLambdaCDM(**LAL_COSMOLOGY_PARAMS)
+        else:
+            cosmology = Planck15
+
+        distances = np.geomspace(*REDSHIFT_GRID_BOUNDS, REDSHIFT_GRID_SIZE)
+        redshifts = np.asarray(
+            z_at_value(cosmology.luminosity_distance, distances * units.Mpc)
+        )
+        return np.log(distances), redshifts
+
     def estimate_redshift(
-        self, distance: float, distance_std: float
-    ) -> Tuple[float, float]:
-        with warnings.catch_warnings():
-            # hide astropy z_at_value warning when input has negative distance
-            warnings.simplefilter("ignore", category=AstropyUserWarning)
-            z = redshift_estimation(distance, distance_std, self.lal_cosmology)
-        return z["central"], z["delta"]
+        self,
+        distance: Union[float, np.ndarray],
+        distance_std: Union[float, np.ndarray],
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        if np.isscalar(distance) and not self.fast:
+            # imported here so the default fast path never touches the heavy
+            # pycbc (and transitively lalsuite) import chain
+            import pycbc.mchirp_area as pycbc_mchirp_area
+            from astropy.utils.exceptions import AstropyUserWarning
+
+            with warnings.catch_warnings():
+                # hide astropy z_at_value warning when input has negative distance
+                warnings.simplefilter("ignore", category=AstropyUserWarning)
+                z = pycbc_mchirp_area.redshift_estimation(
+                    distance, distance_std, self.lal_cosmology
+                )
+            return z["central"], z["delta"]
+
+        # interpolated path - the cosmology is inverted on a grid once per
+        # instance and every subsequent call is an np.interp table lookup
+        if self._redshift_interpolant is None:
+            self._redshift_interpolant = self._build_redshift_interpolant()
+        log_distances, redshifts = self._redshift_interpolant
+        minimum_distance = np.exp(log_distances[0])
+
+        def interpolate_redshift(d: np.ndarray) -> np.ndarray:
+            return np.interp(
+                np.log(np.maximum(d, minimum_distance)), log_distances, redshifts
+            )
+
+        z = interpolate_redshift(distance)
+        z_std = 0.5 * (
+            interpolate_redshift(distance + distance_std)
+            - interpolate_redshift(distance - distance_std)
+        )
+        return z, z_std
 
     def calculate_probabilities(
         self,
-        mchirp: float,
-        z: float,
-        z_std: float,
-    ) -> Dict[str, float]:
-        """Computes the astrophysical source probability of a given candidate event."""
-        assert self.m0 is not None, "coefficient 'm0' is not initialised"
+        mchirp: Union[float, np.ndarray],
+        z: Union[float, np.ndarray],
+        z_std: Union[float, np.ndarray],
+    ) -> Union[Dict[str, float], Dict[str, np.ndarray]]:
+        """Computes the astrophysical source probability of a given candidate event.
+
+        If the inputs are arrays, one probability per event is computed for each
+        source class and a dictionary of arrays is returned instead of floats.
+        """
+        if not np.isscalar(mchirp):
+            if self.fast:
+                return self._calculate_probabilities_batch(mchirp, z, z_std)
+            events = [
+                self.calculate_probabilities(float(mc), float(z_c), float(z_d))
+                for mc, z_c, z_d in zip(mchirp, z, z_std)
+            ]
+            return {
+                key: np.array([event[key] for event in events]) for key in events[0]
+            }
 
         # determine chirp mass bounds in detector frame - mc_det = (1+z)*mc
         get_redshifted_mchirp = lambda m: (m / (2**0.2)) * (1 + z)
@@ -172,13 +338,25 @@ class ChirpMassAreaModel:
                 else:
                     probabilities.update({"MGNS": 0.0, "MGMG": 0.0, "BHMG": 0.0})
 
+        elif self.fast:
+            # integrate region areas with the local fixed-grid quadrature kernels
+            areas = self._calculate_source_areas(mchirp, z, z_std)
+
+            # normalize mass contour area to get probability estimates
+            total_area = sum(areas.values())
+            probabilities = {key: areas[key] / total_area for key in areas}
+
         else:
+            # imported here so the default fast path never touches the heavy
+            # pycbc (and transitively lalsuite) import chain
+            import pycbc.mchirp_area as pycbc_mchirp_area
+
             # specify mass gap class maximum if provided, else match neutron star
             mass_gap = True if self.mass_gap_max is not None else False
             mass_gap_max = self.mass_gap_max or self.ns_max
 
             # compute probabilities according to proportional areas in chirp mass area
-            areas = calc_areas(
+            areas = pycbc_mchirp_area.calc_areas(
                 trig_mc_det={"central": mchirp, "delta": mchirp * self.m0},
                 mass_limits=dict(zip(("min_m2", "max_m1"), self.mass_bounds)),
                 mass_bdary={"ns_max": self.ns_max, "gap_max": mass_gap_max},
@@ -189,7 +367,7 @@ class ChirpMassAreaModel:
 
             # rename keys output by calc_areas if component mass gaps are computed
             if mass_gap:
-                key_map = {"Mass Gap": "MG", "GG": "MGMG", "GNS": "MGNS"}
+                key_map = {"Mass Gap": "MG", "GG": "MGMG", "GNS": "MGNS", "BHG": "BHMG"}
                 for key in list(areas):
                     if key in key_map:
                         areas[key_map[key]] = areas.pop(key)
@@ -200,6 +378,60 @@ class ChirpMassAreaModel:
 
         return probabilities
 
+    def _calculate_source_areas(
+        self,
+        mchirp: Union[float, np.ndarray],
+        z: Union[float, np.ndarray],
+        z_std: Union[float, np.ndarray],
+    ) -> Union[Dict[str, float], Dict[str, np.ndarray]]:
+        """Integrates the chirp mass contour areas for each source class with the
+        local quadrature kernels, combining mass gap regions as configured."""
+        if self._region_grids is None:
+            self._region_grids = make_region_grids(
+                self.mass_bounds, self.ns_max, self.mass_gap_max
+            )
+        areas = calc_source_areas(
+            mchirp,
+            mchirp * self.m0,
+            z,
+            z_std,
+            self.mass_bounds,
+            self.ns_max,
+            self.mass_gap_max,
+            grids=self._region_grids,
+        )
+        if "MG" in self.source_classes:
+            areas["MG"] = areas["MGNS"] + areas["MGMG"] + areas["BHMG"]
+        return {key: areas[key] for key in self.source_classes}
+
+    def _calculate_probabilities_batch(
+        self,
+        mchirp: np.ndarray,
+        z: np.ndarray,
+        z_std: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Computes source class probabilities for a batch of events in one pass
+        over the quadrature kernels, without a per-event Python loop."""
+        areas = self._calculate_source_areas(mchirp, z, z_std)
+
+        # events outside the detector frame chirp mass bounds integrate to zero
+        # area everywhere, so guard the normalization before assigning them
+        total_area = sum(areas.values())
+        norm = np.where(total_area > 0.0, total_area, 1.0)
+
+        # detector frame chirp mass bounds for each event - mc_det = (1+z)*mc
+        mchirp_min, mchirp_max = ((m / (2**0.2)) * (1 + z) for m in self.mass_bounds)
+        below, above = mchirp < mchirp_min, mchirp > mchirp_max
+
+        probabilities = {}
+        for key in self.source_classes:
+            prob = areas[key] / norm
+            prob = np.where(below, 1.0 if key == "BNS" else 0.0, prob)
+            prob = np.where(above, 1.0 if key == "BBH" else 0.0, prob)
+            probabilities[key] = prob
+
+        return probabilities
+
     def fit(
         self,
         snr: np.ndarray,
@@ -217,12 +449,11 @@ class ChirpMassAreaModel:
         property. If m0 is provided but self.m0 is already initialised, m0 will be
         overwritten with the new value.
 
-        This function uses numpy's Polynomial function to fit the coefficients for
-        the chirp mass area model - specifically for estimating luminosity distance
-        uncertainty (standard deviation) as a function of the estimated BAYESTAR
-        luminosty distance and the recovered trigger Signal to Noise (SNR) ratios.
-
-        See: https://numpy.org/doc/stable/reference/routines.polynomials.html
+        The coefficients for estimating luminosity distance uncertainty (standard
+        deviation) as a function of the estimated BAYESTAR luminosity distance and
+        the recovered trigger Signal to Noise (SNR) ratios are fit by closed-form
+        degree-1 least squares in log-log space, matching what
+        numpy.polynomial.Polynomial.fit would return to floating point rounding.
 
         Parameters
         ----------
@@ -241,50 +472,89 @@ class ChirpMassAreaModel:
         """
         # specify chirp mass uncertainty constant
         self.m0 = m0 or self.m0
-        assert self.m0 is not None, "coefficient 'm0' is not initialised"
+        if self.m0 is None:
+            raise ValueError("coefficient 'm0' is not initialised")
 
         # a0 taken as mean ratio between lum dist and (minimum) effective distances)
-        self.a0 = float(np.mean(bayestar_distance / eff_distance))
+        ratio = bayestar_distance / eff_distance
+        self.a0 = float(ratio.mean())
 
-        # estimate BAYESTAR luminosity distances
-        luminosity_distance = self.estimate_luminosity_distance(eff_distance)
+        # estimate BAYESTAR luminosity distances directly from the fitted a0
+        luminosity_distance = self.a0 * eff_distance
         norm_bayestar_distance_std = bayestar_distance_std / luminosity_distance
 
-        # fit luminosity distance uncertainty as a function of SNR
-        b = Polynomial.fit(np.log(snr), np.log(norm_bayestar_distance_std), 1)
-        self.b1, self.b0 = b.convert().coef
+        # fit luminosity distance uncertainty as a function of SNR, taking the
+        # log of the freshly allocated ratio in-place to skip one temporary
+        log_snr = np.log(snr)
+        np.log(norm_bayestar_distance_std, out=norm_bayestar_distance_std)
+
+        # closed-form least squares for the degree-1 fit - equivalent to
+        # Polynomial.fit(..., 1).convert().coef without the Vandermonde + SVD
+        log_snr_mean = log_snr.mean()
+        log_std_mean = norm_bayestar_distance_std.mean()
+        dx = log_snr - log_snr_mean
+        self.b0 = float(
+            (dx * (norm_bayestar_distance_std - log_std_mean)).sum() / (dx * dx).sum()
+        )
+        self.b1 = float(log_std_mean - self.b0 * log_snr_mean)
 
+        self._validate()
+        logger.info("Fitted coefficients for %r.", self)
         return self
 
     def predict(
         self,
-        mchirp: float,
-        snr: float,
-        eff_distance: float,
-    ) -> Dict[str, float]:
+        mchirp: Union[float, np.ndarray],
+        snr: Union[float, np.ndarray],
+        eff_distance: Union[float, np.ndarray],
+        return_array: bool = False,
+    ) -> Union[
+        Dict[str, float], Dict[str, np.ndarray], Tuple[Tuple[str, ...], np.ndarray]
+    ]:
         """
         Computes the different probabilities that a candidate event belongs to each
         CBC source class according to search.classify.mchirp_areas.calc_probabilities.
 
+        Scalar inputs follow the original one-event-at-a-time code path, while
+        equal length arrays are broadcast through the distance and redshift
+        estimation steps in one vectorized pass over all events.
+
         Parameters
         ----------
-        mchirp: float
+        mchirp: float | np.ndarray
             The source frame chirp mass.
-        snr: float
+        snr: float | np.ndarray
             The coincident signal-to-noise ratio (SNR)
-        eff_distance: float
+        eff_distance: float | np.ndarray
             The estimated effective distance to the event,
             usually taken as the minimum across all coincident detectors.
+        return_array: bool
+            If True, return a (classes, probabilities) tuple where the
+            probabilities are one array with class as its last axis, rather
+            than boxing each class back into a dict entry.
 
         Returns
         -------
-        dict[str, float]
+        dict[str, float] | dict[str, np.ndarray] | tuple[tuple[str, ...], np.ndarray]
             The astrophysical source probabilities for each class.
         """
+        self._validate()
+
+        if not np.isscalar(mchirp):
+            mchirp = np.asarray(mchirp, dtype=self.dtype)
+            snr = np.asarray(snr, dtype=self.dtype)
+            eff_distance = np.asarray(eff_distance, dtype=self.dtype)
 
         distance, distance_std = self.estimate_distance(eff_distance, snr)
         z, z_std = self.estimate_redshift(distance, distance_std)
-        return self.calculate_probabilities(mchirp, z, z_std)
+        probabilities = self.calculate_probabilities(mchirp, z, z_std)
+
+        if return_array:
+            classes = self.source_classes
+            return classes, np.stack(
+                [np.asarray(probabilities[key]) for key in classes], axis=-1
+            )
+        return probabilities
 
     def plot(
         self,
@@ -316,12 +586,15 @@ class ChirpMassAreaModel:
             The mass contour on the chirp mass area plane as a matplotlib Axes.
         """
         # TODO: Implement a more efficient solution when we want to predict + plot.
+        import pycbc.mchirp_area as pycbc_mchirp_area
 
         # estimate source frame chirp mass from trigger data
-        assert self.m0 is not None
+        self._validate()
         distance, distance_std = self.estimate_distance(eff_distance, snr)
         z, z_std = self.estimate_redshift(distance, distance_std)
-        m_src, m_src_std = src_mass_from_z_det_mass(z, z_std, mchirp, mchirp * self.m0)
+        m_src, m_src_std = pycbc_mchirp_area.src_mass_from_z_det_mass(
+            z, z_std, mchirp, mchirp * self.m0
+        )
 
         return draw_mass_contour_plane(
             ax or plt.gca(),  # use the provided matplotlib axes, else create one
@@ -339,7 +612,7 @@ class ChirpMassAreaModel:
         if file_path.suffix == ".pkl":
             self.save_pkl(file_path)
         elif file_path.suffix == ".json":
-            self.load_json(file_path)
+            self.save_json(file_path)
         else:
             raise RuntimeError(
                 f"Save failed - cannot detect file type: {file_path.suffix}. "
@@ -358,23 +631,50 @@ class ChirpMassAreaModel:
                 "Valid file types are '.pkl' or '.json'."
             )
 
+    def _state(self) -> Dict:
+        """Returns the picklable model state, excluding private runtime caches."""
+        public_slots = (key for key in self.__slots__ if not key.startswith("_"))
+        state = {key: getattr(self, key) for key in public_slots}
+        # property-backed values whose slots are underscore-private
+        state["b1"] = self.b1
+        state["dtype"] = self.dtype.name
+        return state
+
     def save_pkl(self, path: Union[str, Path]):
+        warnings.warn(
+            "save_pkl is deprecated - the model state is a handful of scalar "
+            "coefficients, use save_json instead.",
+            DeprecationWarning,
+        )
         with Path(path).open(mode="wb") as f:
-            pickle.dump(self.__dict__, f)
+            pickle.dump(self._state(), f)
 
     def save_json(self, path: Union[str, Path], indent: int = 4):
         with Path(path).open(mode="w") as f:
-            json.dump(self.__dict__, f, indent=indent)
+            json.dump(self._state(), f, indent=indent)
 
     def load_pkl(self, path: Union[str, Path]):
         with Path(path).open(mode="rb") as f:
-            self.__dict__ = pickle.load(f)
+            state = pickle.load(f)
+        for key in state:
+            setattr(self, key, state[key])
+        self._refresh_caches()
+        self._validate()
 
     def load_json(self, path: Union[str, Path]):
         with Path(path).open(mode="r") as f:
             state = json.load(f)
         for key in state:
             setattr(self, key, state[key])
+        self._refresh_caches()
+        self._validate()
+
+    def _refresh_caches(self):
+        """Invalidates derived caches after loading model state, as the loaded
+        boundaries or cosmology may have changed; exp(b1) is maintained by the
+        b1 property setter."""
+        self._redshift_interpolant = None
+        self._region_grids = None
 
 
 def draw_mass_contour_plane(
@@ -395,6 +695,10 @@ def draw_mass_contour_plane(
     - https://github.com/veronica-villa/source_probabilities_estimation_pycbclive
         /blob/f2656b4762a232d4758db88569e0b7ab45756ead/mc_area_plots.py
     """
+    import pycbc.conversions
+
+    mcm1_to_m2 = pycbc.conversions.mass2_from_mchirp_mass1
+
     # determine component masses (when m1 = m2) given chirp mass boundaries
     mcs, mcb = mchirp_lower, mchirp_upper
     mib = (2.0**0.2) * mcb
@@ -3,21 +3,130 @@
 Code sourced from https://git.ligo.org/lscsoft/p-astro/-/tree/master/ligo.
 """
 
+import json
 import logging
 import pickle
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Union
 
+import lazy_loader as lazy
 import numpy as np
-from ligo.p_astro import MarginalizedPosterior, SourceType
-from ligo.p_astro.computation import get_f_over_b
 
+from ._area_kernels import NUMBA_AVAILABLE, njit, prange
+
+try:
+    # optional AOT compiled kernel built by setup.py when Cython is available;
+    # preferred over the numba JIT as it has no warm-up cost
+    from ._pastro_c import pastro_kernel as _pastro_kernel_c
+except ImportError:
+    _pastro_kernel_c = None
 from .mchirp_area import ChirpMassAreaModel
 
+if TYPE_CHECKING:
+    from ligo.p_astro import MarginalizedPosterior
+
+pd = lazy.load("pandas")
+
 logger = logging.getLogger(__name__)
 
+# valid count prior distributions accepted by ligo.p_astro.MarginalizedPosterior
+_VALID_PRIOR_TYPES = frozenset({"Uniform", "Jeffreys"})
+
+# SNR exponent in the FGMC bayes factor, fixed by convention in ligo.p_astro
+_SNR_POWER = 4
+
+
+@njit(cache=True, fastmath=True)
+def _f_over_b_jit(far, snr, far_star, snr_star):
+    """JIT compiled bayes factor kernel - one fused loop with no temporaries."""
+    out = np.empty(far.shape[0])
+    c = 3.0 * snr_star**3.0 * far_star
+    for i in range(far.shape[0]):
+        out[i] = c / (far[i] * snr[i] ** 4.0)
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _pastro_kernel(far, snr, far_star, snr_star, mean_astro, mean_terr, out):
+    """Fused bayes factor and two component posterior kernel.
+
+    Writes p_astro directly into ``out`` in a single parallel pass, avoiding
+    the intermediate bayes factor array of the two-step path.
+    """
+    c = 3.0 * snr_star**3.0 * far_star
+    for i in prange(far.shape[0]):
+        x = mean_astro * c / (far[i] * snr[i] ** 4.0)
+        out[i] = x / (x + mean_terr)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _composite_kernel(astro_probs, source_probs, out):
+    """Scales every source class probability by p_astro and fills the trailing
+    Terrestrial column with 1 - p_astro, in one parallel pass over events."""
+    n, m = source_probs.shape
+    for i in prange(n):
+        a = astro_probs[i]
+        for j in range(m):
+            out[i, j] = source_probs[i, j] * a
+        out[i, m] = 1.0 - a
+
+
+if NUMBA_AVAILABLE:
+    # pay the (cached) JIT compilation once at import rather than on the first
+    # candidate event of a low-latency run
+    _f_over_b_jit(np.ones(1), np.ones(1), 1.0, 1.0)
+    _pastro_kernel(np.ones(1), np.ones(1), 1.0, 1.0, 1.0, 1.0, np.empty(1))
+    _composite_kernel(np.ones(1), np.ones((1, 1)), np.empty((1, 2)))
+
+
+def _get_f_over_b(
+    far: Union[float, np.ndarray],
+    snr: Union[float, np.ndarray],
+    far_star: float,
+    snr_star: float,
+) -> np.ndarray:
+    """Computes the FGMC foreground vs background bayes factor for each event.
+
+    Branchless vectorized equivalent of ligo.p_astro.computation.get_f_over_b,
+    dispatched to the numba kernel when available and NumPy ufuncs otherwise.
+    """
+    far = np.asarray(far)
+    snr = np.asarray(snr)
+    if far.dtype.kind != "f":
+        far = far.astype(np.float64)
+    if snr.dtype.kind != "f":
+        snr = snr.astype(np.float64)
+    if NUMBA_AVAILABLE and far.ndim == 1 and far.shape == snr.shape:
+        return _f_over_b_jit(far, snr, far_star, snr_star)
+    if far.shape == snr.shape:
+        # factored as (3*far_star/snr_star) * (snr_star/snr)**p / far so the
+        # whole fallback runs in a single buffer via out= ufunc calls
+        out = np.divide(snr_star, snr)
+        np.power(out, _SNR_POWER, out=out)
+        out *= 3.0 * far_star / snr_star
+        np.divide(out, far, out=out)
+        return out
+    return (3.0 * snr_star**3.0 * far_star) / (far * snr**_SNR_POWER)
+
 
 class TwoComponentModel:
+    __slots__ = (
+        "far_star",
+        "snr_star",
+        "thresholds",
+        "prior_type",
+        "marginalized_posterior",
+        "mean_counts",
+        "far_live_time",
+        "_Na",
+        "_Nt",
+        "_mean_counts_arr",
+        "_predict_kernel",
+        "_dtype",
+        "_categories",
+        "_bf_dict_template",
+    )
+
     def __init__(
         self,
         far_star: float = 3e-4,
@@ -25,6 +134,7 @@ class TwoComponentModel:
         thresholds: Dict[str, Dict[str, float]] = None,
         far_live_time: Optional[float] = None,
         prior_type: str = "Uniform",
+        dtype: Union[str, np.dtype] = np.float64,
     ):
         # set FAR and SNR thresholds to classify as astro source for bayes factor model
         self.far_star = far_star
@@ -32,24 +142,47 @@ class TwoComponentModel:
         self.thresholds = thresholds
 
         # assign prior distribution type to counts
-        valid_prior_types = ("Uniform", "Jeffreys")
-        if prior_type not in valid_prior_types:
-            raise ValueError(f"{prior_type} must be one of {valid_prior_types}.")
+        if prior_type not in _VALID_PRIOR_TYPES:
+            raise ValueError(
+                f"{prior_type} must be one of {', '.join(sorted(_VALID_PRIOR_TYPES))}."
+            )
         self.prior_type = prior_type
 
         # mean posterior counts
-        self.marginalized_posterior: Optional[MarginalizedPosterior] = None
+        self.marginalized_posterior: Optional["MarginalizedPosterior"] = None
         self.mean_counts: Optional[Dict[str, float]] = None
         self.far_live_time = far_live_time  # if not None, set noise counts with this
 
+        # cached Astro/Terr mean counts for the closed-form predict path, and
+        # a frozen numeric kernel closing over them built at fit/load time
+        self._Na: Optional[float] = None
+        self._Nt: Optional[float] = None
+        self._mean_counts_arr: Optional[np.ndarray] = None
+        self._predict_kernel = None
+
+        # floating point width for batched prediction - fitting stays float64
+        self.dtype = dtype
+
+        # reusable argument containers for the legacy pastro_update fallback,
+        # refreshed in place rather than rebuilt per predict call
+        self._categories = ["Astro"]
+        self._bf_dict_template: Dict[str, Optional[np.ndarray]] = {"Astro": None}
+
+    @property
+    def dtype(self) -> np.dtype:
+        """The floating point precision used for batched prediction inputs."""
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value: Union[str, np.dtype]):
+        self._dtype = np.dtype(value)
+
     def __repr__(self, precision: int = 4):
         """Overrides string representation of cls when printed."""
         if self.mean_counts is not None:
             mean_counts = ", ".join(
-                [
-                    f"{key}={self.mean_counts[key]:.{precision}f}"
-                    for key in self.mean_counts
-                ]
+                f"{key}={value:.{precision}f}"
+                for key, value in self.mean_counts.items()
             )
             return f"{type(self).__name__}({mean_counts})"
         else:
@@ -90,23 +223,63 @@ class TwoComponentModel:
         bounded_snr = np.where(is_beyond_threshold, snr_threshold, snr)
         return bounded_snr if isinstance(snr, Iterable) else bounded_snr.item()
 
-    def fit(
-        self, far: np.ndarray, snr: np.ndarray, far_live_time: Optional[float] = None
-    ):
-        # approximate bayes factor
-        bayes_factors = get_f_over_b(far, snr, self.far_star, self.snr_star)
-        assert len(bayes_factors.shape) == 1, "bayes_factors should be a 1-dim array."
-
-        # construct two component posterior for signal vs. noise
-        astro = SourceType(label="Astro", w_fgmc=np.ones(len(bayes_factors)))
-        terr = SourceType(label="Terr", w_fgmc=np.ones(len(bayes_factors)))
-        self.marginalized_posterior = MarginalizedPosterior(
+    def _build_predict_kernel(self):
+        """Returns a closure over the mean counts as local floats, so predict
+        pays no instance attribute or dict lookups on the numeric path."""
+        mean_astro, mean_terr = self._Na, self._Nt
+
+        def kernel(bayes_factors):
+            x = mean_astro * bayes_factors
+            return x / (x + mean_terr)
+
+        return kernel
+
+    def _build_posterior(self, bayes_factors: np.ndarray) -> "MarginalizedPosterior":
+        """Constructs the two component signal vs. noise marginalized posterior
+        from the per-trigger bayes factors with uniform event weights."""
+        # imported here so that predict-only workers restored via load_pkl
+        # never pay the ligo.p_astro (and transitively pycbc/LAL) import cost
+        import ligo.p_astro as ligo_p_astro
+
+        class _UniformSourceType(ligo_p_astro.SourceType):
+            """SourceType with implicit uniform weights backed by a zero-copy
+            broadcast view, so no per-event weight storage is materialized.
+
+            Interim until upstream accepts a scalar or ``None`` weight; the
+            posterior's per-event weight multiplications themselves cannot be
+            short-circuited without vendoring MarginalizedPosterior.
+            """
+
+            def __init__(self, label: str, n_events: int):
+                super().__init__(
+                    label=label,
+                    w_fgmc=np.broadcast_to(np.float64(1.0), (n_events,)),
+                )
+
+        n_events = len(bayes_factors)
+        astro = _UniformSourceType("Astro", n_events)
+        terr = _UniformSourceType("Terr", n_events)
+        return ligo_p_astro.MarginalizedPosterior(
             f_divby_b=bayes_factors,
             prior_type=self.prior_type,
             terr_source=terr,
             **{"Astro": astro},
         )
 
+    def fit(
+        self, far: np.ndarray, snr: np.ndarray, far_live_time: Optional[float] = None
+    ):
+        # approximate bayes factor - fitting always runs in full precision
+        # regardless of the prediction dtype
+        far = np.asarray(far, dtype=np.float64)
+        snr = np.asarray(snr, dtype=np.float64)
+        bayes_factors = _get_f_over_b(far, snr, self.far_star, self.snr_star)
+        if bayes_factors.ndim != 1:
+            raise ValueError("bayes_factors should be a 1-dim array.")
+
+        # construct two component posterior for signal vs. noise
+        self.marginalized_posterior = self._build_posterior(bayes_factors)
+
         # update expected mean counts given observed data
         self.mean_counts = {
             key: self.marginalized_posterior.getOneDimMean(category=key)
@@ -117,64 +290,183 @@ class TwoComponentModel:
         if far_live_time is not None:
             self.mean_counts["Terr"] = self.far_star * far_live_time
 
+        self._Na = float(self.mean_counts["Astro"])
+        self._Nt = float(self.mean_counts["Terr"])
+        self._mean_counts_arr = np.array([self._Na, self._Nt], dtype=np.float64)
+        self._predict_kernel = self._build_predict_kernel()
+
         return self
 
     def predict(
         self,
-        far: float,
-        snr: float,
+        far: Union[float, np.ndarray],
+        snr: Union[float, np.ndarray],
         ifos: Optional[Iterable[str]] = None,
-    ) -> float:
-        assert self.marginalized_posterior is not None, "Model not fit - call .fit()."
+    ) -> Union[float, np.ndarray]:
+        assert self.mean_counts is not None, "Model not fit - call .fit()."
 
         # Ensure SNR does not increase indefinitely beyond limiting FAR
         if self.thresholds is not None and ifos is not None:
             snr = self.bound_snr(far, snr, ifos)
 
+        # only unbox back to a float when both inputs are scalar - a scalar far
+        # against an snr batch (or vice versa) broadcasts to the full batch
+        scalar_input = np.isscalar(far) and np.isscalar(snr)
+        far = np.atleast_1d(np.asarray(far, dtype=self.dtype))
+        snr = np.atleast_1d(np.asarray(snr, dtype=self.dtype))
+
+        if self._Na is not None and far.shape == snr.shape:
+            # fused single-pass kernel - bayes factor and posterior together,
+            # no intermediate array between the two stages; compiled > JIT
+            use_compiled = (
+                _pastro_kernel_c is not None
+                and far.dtype == np.float64
+                and snr.dtype == np.float64
+                and far.flags.c_contiguous
+                and snr.flags.c_contiguous
+            )
+            if use_compiled or NUMBA_AVAILABLE:
+                kernel = _pastro_kernel_c if use_compiled else _pastro_kernel
+                # mean counts as native float64 scalars from the packed array,
+                # with no per-call dict unboxing
+                counts = self._mean_counts_arr
+                p_astro = np.empty_like(far)
+                kernel(
+                    far,
+                    snr,
+                    self.far_star,
+                    self.snr_star,
+                    counts[0],
+                    counts[1],
+                    p_astro,
+                )
+                return float(p_astro[0]) if scalar_input else p_astro
+
         # compute bayes factor for foreground vs background trigger distribution
-        bayes_factors = get_f_over_b(far, snr, self.far_star, self.snr_star)
+        bayes_factors = _get_f_over_b(far, snr, self.far_star, self.snr_star)
+
+        if self._predict_kernel is not None:
+            # closed-form two-component posterior - for mean counts Na and Nt,
+            # p_astro = Na*bf / (Na*bf + Nt), vectorized over the event batch
+            p_astro = self._predict_kernel(bayes_factors)
+            return float(p_astro[0]) if scalar_input else p_astro
 
-        # return p_astro calculation for the given trigger
+        # fallback for models restored from state saved before the cached counts
+        self._bf_dict_template["Astro"] = bayes_factors
         return self.marginalized_posterior.pastro_update(
-            categories=["Astro"],
-            bayesfac_dict={"Astro": bayes_factors},
+            categories=self._categories,
+            bayesfac_dict=self._bf_dict_template,
             mean_values_dict=self.mean_counts,
         )
 
+    def predict_scalar(self, far: float, snr: float) -> float:
+        """Computes p_astro for a single trigger with no array allocation.
+
+        Inlines the bayes factor and the two-component posterior formula as
+        plain float arithmetic - the low-latency per-event fast path.
+        """
+        assert self._Na is not None, "Model not fit - call .fit()."
+        x = self._Na * (3.0 * self.snr_star**3.0 * self.far_star) / (far * snr**4.0)
+        return x / (x + self._Nt)
+
     def save(self, path: Union[str, Path]):
         file_path = Path(path)
         if file_path.suffix == ".pkl":
             self.save_pkl(file_path)
+        elif file_path.suffix == ".npz":
+            self.save_npz(file_path)
         elif file_path.suffix == ".json":
             raise NotImplementedError("JSON compatibility not yet implemented.")
         else:
             raise RuntimeError(
                 f"Save failed - cannot detect file type: {file_path.suffix}. "
-                "Valid file types are '.pkl'."
+                "Valid file types are '.pkl' or '.npz'."
             )
 
     def load(self, path: Union[str, Path]):
         file_path = Path(path)
         if file_path.suffix == ".pkl":
             self.load_pkl(file_path)
+        elif file_path.suffix == ".npz":
+            self.load_npz(file_path)
         elif file_path.suffix == ".json":
             raise NotImplementedError("JSON compatibility not yet implemented.")
         else:
             raise RuntimeError(
                 f"Save failed - cannot detect file type: {file_path.suffix}. "
-                "Valid file types are '.pkl'."
+                "Valid file types are '.pkl' or '.npz'."
             )
 
+    def save_npz(self, path: Union[str, Path]):
+        """Saves the model as compressed arrays with a JSON metadata sidecar,
+        avoiding pickle and its cross-version compatibility issues."""
+        assert self.marginalized_posterior is not None, "Model not fit - call .fit()."
+        meta = {
+            "far_star": self.far_star,
+            "snr_star": self.snr_star,
+            "thresholds": self.thresholds,
+            "prior_type": self.prior_type,
+            "far_live_time": self.far_live_time,
+            "mean_counts": self.mean_counts,
+        }
+        np.savez_compressed(
+            Path(path),
+            f_divby_b=np.asarray(self.marginalized_posterior.f_divby_b),
+            meta=json.dumps(meta),
+        )
+
+    def load_npz(self, path: Union[str, Path]):
+        """Restores a model saved by save_npz, reconstructing the marginalized
+        posterior from the persisted per-trigger bayes factors."""
+        with np.load(Path(path), allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            bayes_factors = np.asarray(data["f_divby_b"])
+
+        for key in meta:
+            setattr(self, key, meta[key])
+
+        self.marginalized_posterior = self._build_posterior(bayes_factors)
+        if self.mean_counts is not None:
+            self._Na = float(self.mean_counts["Astro"])
+            self._Nt = float(self.mean_counts["Terr"])
+            self._mean_counts_arr = np.array([self._Na, self._Nt], dtype=np.float64)
+            self._predict_kernel = self._build_predict_kernel()
+
     def save_pkl(self, path: Union[str, Path]):
+        """Saves the small numeric state needed for prediction, rather than the
+        full ``__dict__`` with its O(n_events) marginalized posterior arrays."""
+        state = {
+            "far_star": self.far_star,
+            "snr_star": self.snr_star,
+            "thresholds": self.thresholds,
+            "prior_type": self.prior_type,
+            "far_live_time": self.far_live_time,
+            "mean_counts": self.mean_counts,
+        }
         with Path(path).open(mode="wb") as f:
-            pickle.dump(self.__dict__, f)
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def load_pkl(self, path: Union[str, Path]):
+        """Restores a model saved by save_pkl as a predict-only instance.
+
+        Legacy pickles of the full ``__dict__`` (including the marginalized
+        posterior) are also accepted; either way the cached mean counts are
+        rebuilt so the closed-form predict path is available.
+        """
         with Path(path).open(mode="rb") as f:
-            self.__dict__ = pickle.load(f)
+            state = pickle.load(f)
+        for key in state:
+            setattr(self, key, state[key])
+        if self.mean_counts is not None:
+            self._Na = float(self.mean_counts["Astro"])
+            self._Nt = float(self.mean_counts["Terr"])
+            self._mean_counts_arr = np.array([self._Na, self._Nt], dtype=np.float64)
+            self._predict_kernel = self._build_predict_kernel()
 
 
 class CompositeModel:
+    __slots__ = ("signal_model", "source_model")
+
     def __init__(
         self,
         signal_model: Optional[TwoComponentModel] = None,
@@ -193,14 +485,98 @@ class CompositeModel:
 
     def predict(
         self,
-        far: float,
-        snr: float,
-        mchirp: float,
-        eff_dist: float,
+        far: Union[float, np.ndarray],
+        snr: Union[float, np.ndarray],
+        mchirp: Union[float, np.ndarray],
+        eff_dist: Union[float, np.ndarray],
         ifos: Optional[Iterable[str]] = None,
-    ) -> Dict[str, float]:
-        astro_prob = self.signal_model.predict(far, snr, ifos)
-        source_probs = self.source_model.predict(mchirp, snr, eff_dist)
-        probs = {key: source_probs[key] * astro_prob for key in source_probs}
-        probs.update({"Terrestrial": 1 - astro_prob})
+    ) -> Dict[str, Union[float, np.ndarray]]:
+        """Computes source class probabilities for one event or a batch.
+
+        For scalar inputs ``ifos`` is the detector combination of that single
+        event (e.g. ``("H1", "L1")``); for array inputs it must instead hold
+        one detector combination per event.
+        """
+        scalar_input = np.isscalar(far)
+
+        # delegate before any array conversion, as the signal model switches
+        # between the scalar and per-event ifos conventions on the shape of snr
+        astro_probs = np.atleast_1d(
+            np.asarray(self.signal_model.predict(far, snr, ifos))
+        )
+        mchirp, snr, eff_dist = map(np.atleast_1d, (mchirp, snr, eff_dist))
+        classes, source_probs = self.source_model.predict(
+            mchirp, snr, eff_dist, return_array=True
+        )
+
+        # scale all source classes by p_astro and append Terrestrial in one
+        # fused pass, re-boxing to a dict only at the boundary
+        out = self._combine_probabilities(astro_probs, source_probs)
+        if scalar_input:
+            probs = dict(zip(classes, out[0, :-1].tolist()))
+            probs["Terrestrial"] = float(out[0, -1])
+        else:
+            probs = {key: out[:, i] for i, key in enumerate(classes)}
+            probs["Terrestrial"] = out[:, -1]
         return probs
+
+    def _combine_probabilities(
+        self, astro_probs: np.ndarray, source_probs: np.ndarray
+    ) -> np.ndarray:
+        """Fills an (n_events, n_classes + 1) buffer with the p_astro scaled
+        source probabilities plus a trailing Terrestrial column, dispatching to
+        the parallel numba kernel when available."""
+        n, m = source_probs.shape
+        out = np.empty((n, m + 1), dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            _composite_kernel(astro_probs, source_probs, out)
+        else:
+            np.multiply(source_probs, astro_probs[:, np.newaxis], out=out[:, :m])
+            np.subtract(1.0, astro_probs, out=out[:, m])
+        return out
+
+    def predict_batch(
+        self,
+        far: np.ndarray,
+        snr: np.ndarray,
+        mchirp: np.ndarray,
+        eff_dist: np.ndarray,
+        ifos: Optional[Iterable[str]] = None,
+    ) -> "pd.DataFrame":
+        """Computes source class probabilities for a batch of candidate events.
+
+        One column per source class (plus Terrestrial) and one row per event,
+        so scoring N triggers costs one vectorized pass through each sub-model
+        and a single output allocation rather than N dict constructions.
+
+        Parameters
+        ----------
+        far: np.ndarray
+            The false alarm rates (FAR) of each event.
+        snr: np.ndarray
+            The coincident signal-to-noise ratios (SNR) of each event.
+        mchirp: np.ndarray
+            The source frame chirp masses of each event.
+        eff_dist: np.ndarray
+            The estimated effective distances to each event.
+        ifos : Iterable | None
+            One detector combination per event, each given as a comma joined
+            string (e.g. "H1,L1") or an iterable of ifo names - unlike the
+            scalar predict call, where ifos describes the single event.
+
+        Returns
+        -------
+        pd.DataFrame
+            The astrophysical source probabilities for each event and class.
+        """
+        far, snr, mchirp, eff_dist = map(np.asarray, (far, snr, mchirp, eff_dist))
+
+        astro_probs = np.asarray(self.signal_model.predict(far, snr, ifos))
+        classes, source_probs = self.source_model.predict(
+            mchirp, snr, eff_dist, return_array=True
+        )
+
+        out = self._combine_probabilities(astro_probs, source_probs)
+        probs = {key: out[:, i] for i, key in enumerate(classes)}
+        probs["Terrestrial"] = out[:, -1]
+        return pd.DataFrame(probs)
@@ -0,0 +1,34 @@
+"""Round-trip tests for ChirpMassAreaModel serialization."""
+
+import numpy as np
+import pytest
+
+from spiir.search.p_astro.mchirp_area import ChirpMassAreaModel
+
+
+@pytest.mark.parametrize("suffix", [".json", ".pkl"])
+def test_state_round_trip(tmp_path, suffix):
+    model = ChirpMassAreaModel(
+        a0=0.7,
+        b0=-1.5,
+        b1=-0.3,
+        m0=0.01,
+        mass_gap_max=5.0,
+        dtype=np.float32,
+    )
+    path = tmp_path / f"model{suffix}"
+    if suffix == ".pkl":
+        with pytest.warns(DeprecationWarning):
+            model.save(path)
+    else:
+        model.save(path)
+
+    restored = ChirpMassAreaModel()
+    restored.load(path)
+
+    assert restored.coefficients == model.coefficients
+    assert restored.dtype == model.dtype
+    # JSON round trips tuples through lists, so compare normalized
+    assert tuple(restored.mass_bounds) == tuple(model.mass_bounds)
+    assert restored.mass_gap_max == model.mass_gap_max
+    assert restored.source_classes == model.source_classes
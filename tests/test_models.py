@@ -0,0 +1,163 @@
+"""Tests for the p_astro signal and composite models.
+
+The internal-consistency tests only need NumPy (plus astropy for the
+composite model's redshift table) and run against whichever bayes factor
+dispatch branch is active in the environment - the compiled Cython kernel,
+the numba JIT, or the NumPy fallback. The comparisons against the upstream
+ligo.p_astro posterior are skipped unless the igwn extra is installed.
+"""
+
+import numpy as np
+import pytest
+
+from spiir.search.p_astro.mchirp_area import ChirpMassAreaModel
+from spiir.search.p_astro.models import (
+    CompositeModel,
+    TwoComponentModel,
+    _get_f_over_b,
+)
+
+FAR_STAR = 3e-4
+SNR_STAR = 8.5
+MEAN_COUNTS = {"Astro": 50.0, "Terr": 1000.0}
+
+FARS = np.geomspace(1e-12, 1e-4, 9)
+SNRS = np.linspace(8.0, 40.0, 9)
+
+
+def make_model(**kwargs):
+    """Builds a predict-ready TwoComponentModel without fitting, so the
+    closed-form paths can be tested without the heavy igwn dependencies."""
+    model = TwoComponentModel(far_star=FAR_STAR, snr_star=SNR_STAR, **kwargs)
+    model.mean_counts = dict(MEAN_COUNTS)
+    model._Na = MEAN_COUNTS["Astro"]
+    model._Nt = MEAN_COUNTS["Terr"]
+    model._mean_counts_arr = np.array([model._Na, model._Nt])
+    model._predict_kernel = model._build_predict_kernel()
+    return model
+
+
+def reference_p_astro(far, snr):
+    """The explicit two component posterior Na*bf / (Na*bf + Nt) with the
+    upstream FGMC bayes factor bf = 3*snr_star^3*far_star / (far*snr^4)."""
+    bayes_factors = 3.0 * SNR_STAR**3.0 * FAR_STAR / (far * snr**4.0)
+    x = MEAN_COUNTS["Astro"] * bayes_factors
+    return x / (x + MEAN_COUNTS["Terr"])
+
+
+def test_get_f_over_b_matches_formula():
+    bayes_factors = _get_f_over_b(FARS, SNRS, FAR_STAR, SNR_STAR)
+    expected = 3.0 * SNR_STAR**3.0 * FAR_STAR / (FARS * SNRS**4.0)
+    np.testing.assert_allclose(bayes_factors, expected, rtol=1e-10)
+
+
+def test_get_f_over_b_2d_matches_1d():
+    # 2-d inputs always take the NumPy fallback, so this pins the fallback
+    # against the 1-d dispatch branch even when numba is installed
+    bayes_factors = _get_f_over_b(
+        np.stack([FARS, FARS]), np.stack([SNRS, SNRS]), FAR_STAR, SNR_STAR
+    )
+    expected = _get_f_over_b(FARS, SNRS, FAR_STAR, SNR_STAR)
+    np.testing.assert_allclose(bayes_factors[0], expected, rtol=1e-12)
+    np.testing.assert_allclose(bayes_factors[1], expected, rtol=1e-12)
+
+
+def test_predict_batch_matches_reference():
+    model = make_model()
+    np.testing.assert_allclose(
+        model.predict(FARS, SNRS), reference_p_astro(FARS, SNRS), rtol=1e-8
+    )
+
+
+def test_predict_scalar_paths_agree():
+    model = make_model()
+    for far, snr in zip(FARS, SNRS):
+        expected = reference_p_astro(far, snr)
+        assert model.predict(float(far), float(snr)) == pytest.approx(
+            expected, rel=1e-8
+        )
+        assert model.predict_scalar(float(far), float(snr)) == pytest.approx(
+            expected, rel=1e-8
+        )
+
+
+def test_predict_broadcasts_mixed_scalar_and_array():
+    # regression: a scalar far against an snr batch must return the batch,
+    # not silently truncate to the first posterior
+    model = make_model()
+    p_astro = model.predict(1e-8, SNRS)
+    assert np.shape(p_astro) == SNRS.shape
+    np.testing.assert_allclose(
+        p_astro, reference_p_astro(np.full_like(SNRS, 1e-8), SNRS), rtol=1e-8
+    )
+
+
+def test_pkl_round_trip(tmp_path):
+    model = make_model(thresholds={"H1,L1": {"far": 1e-6, "snr": 10.0}})
+    path = tmp_path / "model.pkl"
+    model.save_pkl(path)
+
+    restored = TwoComponentModel()
+    restored.load_pkl(path)
+
+    assert restored.far_star == model.far_star
+    assert restored.snr_star == model.snr_star
+    assert restored.thresholds == model.thresholds
+    assert restored.mean_counts == model.mean_counts
+    np.testing.assert_allclose(restored.predict(FARS, SNRS), model.predict(FARS, SNRS))
+
+
+def test_composite_scalar_matches_batch():
+    source_model = ChirpMassAreaModel(
+        a0=0.7, b0=-1.5, b1=-0.3, m0=0.01, mass_gap_max=5.0
+    )
+    model = CompositeModel(make_model(), source_model)
+
+    far = np.array([1e-9, 1e-7, 1e-5])
+    snr = np.array([9.0, 12.0, 20.0])
+    mchirp = np.array([1.4, 10.0, 30.0])
+    eff_dist = np.array([40.0, 100.0, 400.0])
+
+    batch = model.predict(far, snr, mchirp, eff_dist)
+    for i in range(far.shape[0]):
+        single = model.predict(
+            float(far[i]), float(snr[i]), float(mchirp[i]), float(eff_dist[i])
+        )
+        assert set(single) == set(batch)
+        for key in batch:
+            assert single[key] == pytest.approx(batch[key][i], rel=1e-6, abs=1e-12)
+
+
+def test_predict_matches_upstream_pastro_update():
+    pytest.importorskip("ligo.p_astro")
+    rng = np.random.default_rng(1234)
+    far = 10.0 ** rng.uniform(-12.0, -4.0, 256)
+    snr = rng.uniform(8.0, 40.0, 256)
+    model = TwoComponentModel(far_star=FAR_STAR, snr_star=SNR_STAR).fit(far, snr)
+
+    far_grid, snr_grid = (a.ravel() for a in np.meshgrid(FARS, SNRS))
+    bayes_factors = _get_f_over_b(far_grid, snr_grid, FAR_STAR, SNR_STAR)
+    expected = model.marginalized_posterior.pastro_update(
+        categories=["Astro"],
+        bayesfac_dict={"Astro": bayes_factors},
+        mean_values_dict=model.mean_counts,
+    )
+    np.testing.assert_allclose(
+        model.predict(far_grid, snr_grid), expected, rtol=1e-10
+    )
+
+
+def test_npz_round_trip(tmp_path):
+    pytest.importorskip("ligo.p_astro")
+    rng = np.random.default_rng(5678)
+    far = 10.0 ** rng.uniform(-12.0, -4.0, 256)
+    snr = rng.uniform(8.0, 40.0, 256)
+    model = TwoComponentModel(far_star=FAR_STAR, snr_star=SNR_STAR).fit(far, snr)
+
+    path = tmp_path / "model.npz"
+    model.save_npz(path)
+    restored = TwoComponentModel()
+    restored.load_npz(path)
+
+    assert restored.mean_counts == pytest.approx(model.mean_counts)
+    np.testing.assert_allclose(restored.predict(FARS, SNRS), model.predict(FARS, SNRS))